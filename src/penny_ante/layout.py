@@ -1,42 +1,72 @@
 import os
+from types import MappingProxyType
 from typing import AnyStr
 
 from penny_ante.space import Space
 from penny_ante.wheel import Wheel
 
+# The value -> (row, column) positions and the color/dozen/column
+# groupings only depend on the table type, so they are built once per
+# type and shared by every Layout. They are stored as read-only mappings,
+# tuples and frozensets so no Layout can change them.
+_LAYOUT_CACHE = {}
+
+def _build_layout_data(wheel):
+    if wheel.type in _LAYOUT_CACHE:
+        return _LAYOUT_CACHE[wheel.type]
+
+    value_lookup = {}
+    value_lookup['0'] = (0,0)
+    if wheel.type == 'AMERICAN':
+        value_lookup['00'] = (1,0)
+
+    # Set the Values
+    value = 1
+    for column_index in range (1,13):
+        for row_index in range (3):
+            value_lookup[str(value)] = (row_index,column_index)
+            value += 1
+
+    # Group the space values so bets can read them directly
+    red_spaces = frozenset(space.value for space in wheel.spaces if space.color == 'RED')
+    black_spaces = frozenset(space.value for space in wheel.spaces if space.color == 'BLACK')
+    dozens = tuple(
+        frozenset(str(value) for value in range(start, start + 12)) for start in (1, 13, 25)
+    )
+    columns = tuple(
+        frozenset(
+            value for value, (row, column) in value_lookup.items()
+            if row == row_index and column > 0
+        )
+        for row_index in range(3)
+    )
+
+    _LAYOUT_CACHE[wheel.type] = (
+        MappingProxyType(value_lookup), red_spaces, black_spaces, dozens, columns
+    )
+    return _LAYOUT_CACHE[wheel.type]
+
 class Layout:
     def __init__(self, wheel: Wheel):
         self.wheel = wheel
         self.type = wheel.type
 
         # Initialize the layout grid
-        value_lookup = {}
-        layout_by_value = [None] * 3
+        value_lookup, red_spaces, black_spaces, dozens, columns = _build_layout_data(self.wheel)
         layout = [0] * 3 # rows
         for index, row in enumerate(layout):
             layout[index] = [0] * 13
 
         if self.wheel.type == 'AMERICAN':
             layout[0][0] = '0'
-            value_lookup['0'] = [0,0]
             layout[0][1] = '00'
-            value_lookup['00'] =[1,0]
             layout[0][2] = 'XX'
             
         elif self.wheel.type == 'EUROPEAN':
             layout[0][0] = '0'
-            value_lookup['0'] = [0,0]
             layout[0][1] = 'X0'
             layout[0][2] = 'XX'
 
-        # Set the Values
-        value = 1
-        for column_index in range (1,13):
-            for row_index in range (3):
-                layout[row_index][column_index] = value
-                value_lookup[str(value)] = [row_index,column_index]
-                value += 1
-
         # Swap the values with the spaces
         for space in self.wheel.spaces:
             lookup = value_lookup[str(space.value)]
@@ -46,8 +76,17 @@ class Layout:
 
         self.layout = layout
         self.lookup = value_lookup
-    
+
+        self.red_spaces = red_spaces
+        self.black_spaces = black_spaces
+        self.dozens = dozens
+        self.columns = columns
+
         self.dolly = None
     
     def find_space(self, space: AnyStr):
-        return self.layout[self.lookup[space][0]][self.lookup[space][1]]
\ No newline at end of file
+        try:
+            row, column = self.lookup[space]
+        except (KeyError, TypeError):
+            raise Exception("The requested space is not on this layout.") from None
+        return self.layout[row][column]
\ No newline at end of file
@@ -1,8 +1,12 @@
+import sys
+
 class Space:
+    __slots__ = ("value", "color", "wheel_location", "layout_row", "layout_column")
+
     def __init__(self, value):
         if value == None:
             raise Exception("To instantiate a space, a value is required.")
-        self.value = str(value)
+        self.value = sys.intern(str(value))
         self.color = None
         self.wheel_location = None
         self.layout_row = None
@@ -3,11 +3,24 @@ from penny_ante.wheel import Wheel
 
 
 class Table:
-    def __init__(self, table_type) -> object:
-        if table_type == None:
-            raise Exception('Table type must be defined when creating the table.')
-        self.wheel = Wheel(wheel_type = table_type)
-        self.layout = Layout(wheel = self.wheel)
+    def __init__(self, table_type = None, wheel = None, layout = None) -> object:
+        if wheel == None and layout != None:
+            wheel = layout.wheel
+
+        if wheel == None:
+            if table_type == None:
+                raise Exception('Table type must be defined when creating the table.')
+            wheel = Wheel(wheel_type = table_type)
+        elif table_type != None and table_type != wheel.type:
+            raise Exception('Table type must match the type of the wheel provided.')
+
+        if layout == None:
+            layout = Layout(wheel = wheel)
+        elif layout.type != wheel.type:
+            raise Exception('The layout provided must be for the same table type as the wheel.')
+
+        self.wheel = wheel
+        self.layout = layout
 
     def spin_wheel(self):
         self.wheel.spin()
@@ -7,6 +7,11 @@ from penny_ante.space import Space
 
 
 class TestLayout(unittest.TestCase):
+    # Shared by the read-only spot checks so the layout is only built once
+    @classmethod
+    def setUpClass(cls):
+        cls.american_layout = Layout(wheel = Wheel(wheel_type = 'AMERICAN'))
+
     # Require the wheel type or throw an exception
     def test_throw_exception_if_wheel_is_not_set(self):
         with self.assertRaises(Exception):
@@ -25,25 +30,20 @@ class TestLayout(unittest.TestCase):
         self.assertEqual(result, 'EUROPEAN')
 
     def test_spot_check_layout_spaces(self):
-        test_wheel = Wheel(wheel_type = 'AMERICAN')
-        test_layout = Layout(wheel = test_wheel)
-        self.assertEqual(test_layout.layout[0][0].value, '0')
-        self.assertEqual(test_layout.layout[1][0].value, '00')
-        self.assertEqual(test_layout.layout[0][1].value, '1')
-        self.assertEqual(test_layout.layout[1][1].value, '2')
-        self.assertEqual(test_layout.layout[2][1].value, '3')
-        self.assertEqual(test_layout.layout[2][12].value, '36')
-  
+        cases = [
+            ((0,0), '0'), ((1,0), '00'), ((0,1), '1'), ((1,1), '2'), ((2,1), '3'), ((2,12), '36'),
+        ]
+        for (row, column), value in cases:
+            with self.subTest(value = value):
+                self.assertEqual(self.american_layout.layout[row][column].value, value)
 
     def test_spot_check_lookup_spaces(self):
-        test_wheel = Wheel(wheel_type = 'AMERICAN')
-        test_layout = Layout(wheel = test_wheel)
-        self.assertEqual(test_layout.lookup["0"], [0,0])
-        self.assertEqual(test_layout.lookup["00"], [1,0])
-        self.assertEqual(test_layout.lookup["1"], [0,1])
-        self.assertEqual(test_layout.lookup["2"], [1,1])
-        self.assertEqual(test_layout.lookup["3"], [2,1])
-        self.assertEqual(test_layout.lookup["36"], [2,12])
+        cases = [
+            ("0", (0,0)), ("00", (1,0)), ("1", (0,1)), ("2", (1,1)), ("3", (2,1)), ("36", (2,12)),
+        ]
+        for value, position in cases:
+            with self.subTest(value = value):
+                self.assertEqual(self.american_layout.lookup[value], position)
 
     def test_find_space_returns_space(self):
         test_wheel = Wheel(wheel_type = 'AMERICAN')
@@ -52,20 +52,56 @@ class TestLayout(unittest.TestCase):
         self.assertIsInstance(test_space, Space)
 
     def test_find_space(self):
+        for value in ["0", "00", "1", "2", "3", "36"]:
+            with self.subTest(value = value):
+                self.assertEqual(self.american_layout.find_space(value).value, value)
+
+    def test_lookup_shared_between_layouts(self):
+        first_layout = Layout(wheel = Wheel(wheel_type = 'AMERICAN'))
+        second_layout = Layout(wheel = Wheel(wheel_type = 'AMERICAN'))
+        european_layout = Layout(wheel = Wheel(wheel_type = 'EUROPEAN'))
+        self.assertIs(first_layout.lookup, second_layout.lookup)
+        self.assertIsNot(first_layout.lookup, european_layout.lookup)
+        self.assertIsNot(first_layout.layout, second_layout.layout)
+
+    def test_shared_lookup_is_read_only(self):
+        with self.assertRaises(TypeError):
+            self.american_layout.lookup['1'] = (2,2)
+        with self.assertRaises(TypeError):
+            self.american_layout.lookup['1'][0] = 99
+
+    def test_color_groupings(self):
         test_wheel = Wheel(wheel_type = 'AMERICAN')
         test_layout = Layout(wheel = test_wheel)
-        self.assertEqual(test_layout.find_space("0").value, '0')
-        self.assertEqual(test_layout.find_space("00").value, '00')
-        self.assertEqual(test_layout.find_space("1").value, '1')
-        self.assertEqual(test_layout.find_space("2").value, '2')
-        self.assertEqual(test_layout.find_space("3").value, '3')
-        self.assertEqual(test_layout.find_space("36").value, '36')
-    
+        self.assertEqual(len(test_layout.red_spaces), 18)
+        self.assertEqual(len(test_layout.black_spaces), 18)
+        self.assertIn('1', test_layout.red_spaces)
+        self.assertIn('2', test_layout.black_spaces)
+        self.assertNotIn('0', test_layout.red_spaces | test_layout.black_spaces)
+
+    def test_dozen_and_column_groupings(self):
+        test_wheel = Wheel(wheel_type = 'EUROPEAN')
+        test_layout = Layout(wheel = test_wheel)
+        self.assertEqual(test_layout.dozens[0], frozenset(str(value) for value in range(1, 13)))
+        self.assertEqual(test_layout.dozens[2], frozenset(str(value) for value in range(25, 37)))
+        self.assertEqual(test_layout.columns[0], frozenset(str(value) for value in range(1, 37, 3)))
+        self.assertEqual(test_layout.columns[2], frozenset(str(value) for value in range(3, 37, 3)))
+
+    def test_groupings_shared_between_layouts(self):
+        first_layout = Layout(wheel = Wheel(wheel_type = 'AMERICAN'))
+        second_layout = Layout(wheel = Wheel(wheel_type = 'AMERICAN'))
+        self.assertIs(first_layout.red_spaces, second_layout.red_spaces)
+        self.assertIs(first_layout.columns, second_layout.columns)
+
     def test_find_space_throws_exception_if_space_not_valid(self):
         with self.assertRaises(Exception):
             test_wheel = Wheel(wheel_type = 'AMERICAN')
             test_layout = Layout(wheel = test_wheel)
             bad_space = test_layout.find_space("39")
         
+    def test_find_space_throws_exception_if_space_not_hashable(self):
+        with self.assertRaisesRegex(Exception, 'not on this layout'):
+            self.american_layout.find_space(["1"])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
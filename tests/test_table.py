@@ -1,27 +1,74 @@
 import unittest
 
 from .context import penny_ante
+from penny_ante.layout import Layout
 from penny_ante.table import Table
 from penny_ante.space import Space
+from penny_ante.wheel import Wheel
 
 
 
 class TestTable(unittest.TestCase):
-    # Require the table type or throw an exception
+    # The type checks only read the tables, so build each type once
+    @classmethod
+    def setUpClass(cls):
+        cls._american_table = Table(table_type = 'AMERICAN')
+        cls._european_table = Table(table_type = 'EUROPEAN')
+
     def test_create_table_american(self):
-        test_table = Table(table_type = 'AMERICAN')
-        self.assertEqual(test_table.wheel.type, 'AMERICAN')
-        self.assertEqual(test_table.layout.type, 'AMERICAN')
+        self.assertEqual(self._american_table.wheel.type, 'AMERICAN')
+        self.assertEqual(self._american_table.layout.type, 'AMERICAN')
 
     def test_create_table_european(self):
-        test_table = Table(table_type = 'EUROPEAN')
-        self.assertEqual(test_table.wheel.type, 'EUROPEAN')
-        self.assertEqual(test_table.layout.type, 'EUROPEAN')
+        self.assertEqual(self._european_table.wheel.type, 'EUROPEAN')
+        self.assertEqual(self._european_table.layout.type, 'EUROPEAN')
 
     def test_spin_wheel(self):
-        test_table = Table(table_type = 'EUROPEAN')
+        # Spin a fresh wheel on the shared European layout so the class
+        # tables' wheels are left alone
+        test_wheel = Wheel(wheel_type = 'EUROPEAN')
+        test_table = Table(wheel = test_wheel, layout = self._european_table.layout)
         test_table.spin_wheel()
         self.assertIsInstance(test_table.wheel.current_space, Space)
+
+    def test_create_table_with_wheel(self):
+        test_wheel = Wheel(wheel_type = 'AMERICAN')
+        test_table = Table(wheel = test_wheel)
+        self.assertIs(test_table.wheel, test_wheel)
+        self.assertIs(test_table.layout.wheel, test_wheel)
+
+    def test_create_table_with_layout(self):
+        test_layout = Layout(wheel = Wheel(wheel_type = 'EUROPEAN'))
+        test_table = Table(layout = test_layout)
+        self.assertIs(test_table.layout, test_layout)
+        self.assertIs(test_table.wheel, test_layout.wheel)
+
+    def test_create_table_with_type_and_layout(self):
+        test_layout = Layout(wheel = Wheel(wheel_type = 'AMERICAN'))
+        test_table = Table(table_type = 'AMERICAN', layout = test_layout)
+        self.assertIs(test_table.wheel, test_layout.wheel)
+
+    def test_throw_exception_if_table_type_does_not_match_layout(self):
+        with self.assertRaises(Exception):
+            Table(table_type = 'EUROPEAN', layout = self._american_table.layout)
+
+    def test_throw_exception_if_table_type_does_not_match_wheel(self):
+        with self.assertRaises(Exception):
+            Table(table_type = 'EUROPEAN', wheel = Wheel(wheel_type = 'AMERICAN'))
+
+    def test_create_table_with_wheel_and_shared_layout(self):
+        test_wheel = Wheel(wheel_type = 'AMERICAN')
+        test_table = Table(wheel = test_wheel, layout = self._american_table.layout)
+        self.assertIs(test_table.wheel, test_wheel)
+        self.assertIs(test_table.layout, self._american_table.layout)
+
+    def test_throw_exception_if_layout_is_for_another_wheel_type(self):
+        with self.assertRaises(Exception):
+            Table(wheel = Wheel(wheel_type = 'EUROPEAN'), layout = self._american_table.layout)
+
+    def test_throw_exception_if_table_type_is_not_set(self):
+        with self.assertRaises(Exception):
+            Table()
     
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -26,16 +26,16 @@ class TestWheel(unittest.TestCase):
 
     def test_spot_check_european_wheel_spaces(self):
         test_wheel = Wheel(wheel_type = 'EUROPEAN')
-        self.assertEqual(test_wheel.spaces[0].color, 'GREEN')
-        self.assertEqual(test_wheel.spaces[0].value, '0')
-        self.assertEqual(test_wheel.spaces[10].color, 'BLACK')
-        self.assertEqual(test_wheel.spaces[10].value, '6')
-        self.assertEqual(test_wheel.spaces[21].color, 'RED')
-        self.assertEqual(test_wheel.spaces[21].value, '16')
-        self.assertEqual(test_wheel.spaces[30].color, 'BLACK')
-        self.assertEqual(test_wheel.spaces[30].value, '29')        
-        self.assertEqual(test_wheel.spaces[36].color, 'BLACK')
-        self.assertEqual(test_wheel.spaces[36].value, '26')     
+        pockets = (0, 10, 21, 30, 36)
+        actual = tuple((test_wheel.spaces[i].color, test_wheel.spaces[i].value) for i in pockets)
+        expected = (
+            ('GREEN', '0'),
+            ('BLACK', '6'),
+            ('RED', '16'),
+            ('BLACK', '29'),
+            ('BLACK', '26'),
+        )
+        self.assertEqual(actual, expected)
 
     def test_american_wheel_spaces_count_is_correct(self):
         test_wheel = Wheel(wheel_type = 'AMERICAN')
@@ -43,44 +43,41 @@ class TestWheel(unittest.TestCase):
 
     def test_spot_check_american_wheel_spaces(self):
         test_wheel = Wheel(wheel_type = 'AMERICAN')
-        self.assertEqual(test_wheel.spaces[0].color, 'GREEN')
-        self.assertEqual(test_wheel.spaces[0].value, '0')
-        self.assertEqual(test_wheel.spaces[1].color, 'BLACK')
-        self.assertEqual(test_wheel.spaces[1].value, '28')
-        self.assertEqual(test_wheel.spaces[10].color, 'RED')
-        self.assertEqual(test_wheel.spaces[10].value, '5')
-        self.assertEqual(test_wheel.spaces[19].color, 'GREEN')
-        self.assertEqual(test_wheel.spaces[19].value, '00')
-        self.assertEqual(test_wheel.spaces[20].color, 'RED')
-        self.assertEqual(test_wheel.spaces[20].value, '27')
-        self.assertEqual(test_wheel.spaces[21].color, 'BLACK')
-        self.assertEqual(test_wheel.spaces[21].value, '10')
-        self.assertEqual(test_wheel.spaces[30].color, 'RED')
-        self.assertEqual(test_wheel.spaces[30].value, '21')        
-        self.assertEqual(test_wheel.spaces[37].color, 'BLACK')
-        self.assertEqual(test_wheel.spaces[37].value, '2')     
+        pockets = (0, 1, 10, 19, 20, 21, 30, 37)
+        actual = tuple((test_wheel.spaces[i].color, test_wheel.spaces[i].value) for i in pockets)
+        expected = (
+            ('GREEN', '0'),
+            ('BLACK', '28'),
+            ('RED', '5'),
+            ('GREEN', '00'),
+            ('RED', '27'),
+            ('BLACK', '10'),
+            ('RED', '21'),
+            ('BLACK', '2'),
+        )
+        self.assertEqual(actual, expected)
 
+    def test_wheels_share_spaces_by_type(self):
+        first_wheel = Wheel(wheel_type = 'AMERICAN')
+        second_wheel = Wheel(wheel_type = 'AMERICAN')
+        european_wheel = Wheel(wheel_type = 'EUROPEAN')
+        self.assertIs(first_wheel.spaces, second_wheel.spaces)
+        self.assertIsNot(first_wheel.spaces, european_wheel.spaces)
+
+    def test_spin_many(self):
+        test_wheel = Wheel(wheel_type = 'EUROPEAN')
+        results = test_wheel.spin_many(10)
+        self.assertEqual(len(results), 10)
+        for space in results:
+            self.assertIn(space, test_wheel.spaces)
+        self.assertIs(test_wheel.current_space, results[-1])
 
     def test_spin(self):
         test_wheel = Wheel(wheel_type = 'AMERICAN')
-        results = []
-        for iteration in range(100):
-            test_wheel.spin()
-            results.append(test_wheel.current_space.value)
-        
-        values = {}
-        for value in results:
-            if value not in values:
-                values[str(value)] = 0
-
-            values[str(value)] += 1
-        
-        selected_numbers = list(values.keys())
-
-        print(selected_numbers)
+        selected_numbers = {space.value for space in test_wheel.spin_many(20)}
 
-        # Hopefully it doesn't choose the same number 100 times.
-        self.assertNotEqual(selected_numbers[0], selected_numbers[len(selected_numbers)-1])
+        # Hopefully it doesn't choose the same number 20 times.
+        self.assertGreater(len(selected_numbers), 1)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file